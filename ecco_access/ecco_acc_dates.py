@@ -2,8 +2,10 @@
 
 
 import numpy as np
+from functools import lru_cache
 
 
+@lru_cache(maxsize=128)
 def date_adjustment(ShortName,StartDate,EndDate,CMR_query=True):
     """
     Adjusts StartDate and EndDate, augmenting where day or month may be missing.
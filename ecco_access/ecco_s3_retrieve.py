@@ -5,19 +5,71 @@ from .ecco_acc_dates import date_adjustment
 
 ## Initalize Python libraries for module
 import numpy as np
-import pandas as pd
+import fsspec
+import glob
+import random
+import re
 import requests
+import s3fs
+import shutil
 import time as time
 import os.path
+import sys
 from os.path import basename, isfile, isdir, join, expanduser
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import repeat
+import warnings
+from tqdm import tqdm
+from botocore.exceptions import BotoCoreError, ClientError
 from platform import system
 from netrc import netrc
 from urllib import request
 from http.cookiejar import CookieJar
 from getpass import getpass
-import requests
-    
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# ijson enables streaming CMR responses entry-by-entry rather than
+# buffering each full 2000-entry page; fall back to buffered parsing
+# if it is not installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# pre-compiled regex to extract the YYYY-MM-DD date from snapshot file names
+_SNAP_RE = re.compile("_([0-9]{4}-[0-9]{2}-[0-9]{2})")
+
+# shared HTTP session with connection pooling and retries;
+# reusing keep-alive connections avoids a new TCP+TLS handshake on every
+# CMR page request and PO.DAAC credential fetch
+_SESSION = requests.Session()
+_SESSION.mount('https://',\
+               HTTPAdapter(pool_connections=16, pool_maxsize=32,\
+                           max_retries=Retry(total=5, backoff_factor=0.5,\
+                                             status_forcelist=(429,500,502,503,504),\
+                                             respect_retry_after_header=True)))
+
+
+def _retry_s3_op(op, *args, attempts=5, base_delay=0.5, max_delay=8.0):
+    """Helper subroutine that retries an S3 operation with exponential
+    backoff and jitter, so a transient failure does not abort a whole
+    download batch"""
+
+    for attempt in range(attempts):
+        try:
+            return op(*args)
+        except FileNotFoundError:
+            # a missing object (404) is not transient; surface it immediately
+            raise
+        except (OSError, BotoCoreError, ClientError):
+            if attempt == attempts - 1:
+                raise
+            time.sleep(random.uniform(0, min(max_delay, base_delay*(2**attempt))))
+
 
 def setup_earthdata_login_auth(url: str='urs.earthdata.nasa.gov'):
     """Helper subroutine to log into NASA EarthData"""
@@ -42,6 +94,10 @@ def setup_earthdata_login_auth(url: str='urs.earthdata.nasa.gov'):
             file.writelines(lines)
             file.close()
     
+    # attach the credentials to the shared session so that all requests
+    # made through it (CMR queries, S3 credential fetches) are authenticated
+    _SESSION.auth = (username, password)
+
     manager = request.HTTPPasswordMgrWithDefaultRealm()
     manager.add_password(None, url, username, password)
     auth = request.HTTPBasicAuthHandler(manager)
@@ -52,6 +108,28 @@ def setup_earthdata_login_auth(url: str='urs.earthdata.nasa.gov'):
 
 
 
+###================================================================================================================
+
+
+# PO.DAAC S3 credentials expire after ~1 hour; cache them (and the S3
+# filesystem built from them) so repeated retrieval calls within a workflow
+# do not re-fetch credentials or reconstruct the filesystem every time
+_CREDS_URL = 'https://archive.podaac.earthdata.nasa.gov/s3credentials'
+_CREDS_CACHE = {'creds': None, 'expiry': 0.0}
+_S3FS_CACHE = {'s3': None, 'expiry': 0.0, 'max_pool_connections': 0}
+
+
+def _get_s3_creds():
+    """Helper subroutine that returns cached PO.DAAC S3 credentials,
+    re-fetching them when within 5 minutes of expiry"""
+
+    if ((_CREDS_CACHE['creds'] is None) or (time.time() > _CREDS_CACHE['expiry'] - 300)):
+        _CREDS_CACHE['creds'] = _SESSION.get(_CREDS_URL).json()
+        _CREDS_CACHE['expiry'] = time.time() + 3300
+    return _CREDS_CACHE['creds']
+
+
+
 ###================================================================================================================
 
 
@@ -81,53 +159,97 @@ def ecco_podaac_s3_query(ShortName,StartDate,EndDate,snapshot_interval='monthly'
     Returns
     -------
     s3_files_list: str or list, unopened file paths on S3 that match the query
-    
+
     """
 
     pass
 
+    # the query is deterministic over its inputs, so repeat calls with the
+    # same arguments (common in notebook workflows) are served from the
+    # memoized helper; copy the cached list so callers cannot mutate it
+    return list(_ecco_podaac_s3_query_cached(ShortName,StartDate,EndDate,snapshot_interval))
+
+
+
+###================================================================================================================
+
+
+@lru_cache(maxsize=128)
+def _ecco_podaac_s3_query_cached(ShortName,StartDate,EndDate,snapshot_interval='monthly'):
+    """Memoized body of ecco_podaac_s3_query"""
 
     ## Define Helper Subroutines
     
     ### Helper subroutines to make the API calls to search CMR and parse response
     def set_params(params: dict):
-        params.update({'scroll': "true", 'page_size': 2000})
+        params.update({'page_size': 2000})
         return {par: val for par, val in params.items() if val is not None}
-    
-    def get_results(params: dict, headers: dict=None):
-        response = requests.get(url="https://cmr.earthdata.nasa.gov/search/granules.json", 
+
+    def get_results(params: dict, search_after: str=None):
+        # pass the CMR-Search-After token from the previous page (if any)
+        # so CMR resumes the search where the last page ended;
+        # stream=True defers the body download so entries can be parsed as they arrive
+        headers = None
+        if search_after is not None:
+            headers = {'CMR-Search-After': search_after}
+        response = _SESSION.get(url="https://cmr.earthdata.nasa.gov/search/granules.json",
                                 params=set_params(params),
-                                headers=headers).json()
-        return response    
-    
+                                headers=headers,
+                                stream=True)
+        if response.status_code != 200:
+            raise Exception(response.json()['errors'][0])
+        return response, response.headers.get('CMR-Search-After')
+
+    def iter_entries(response):
+        # stream-parse granule entries as they arrive when ijson is available,
+        # avoiding buffering the full 2000-entry page into dicts up front
+        if ijson is not None:
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, 'feed.entry.item')
+        else:
+            yield from response.json()['feed']['entry']
+
     def get_granules(params: dict, ShortName: str, SingleDay_flag: bool):
-        time_start = np.array([]).astype('datetime64[ns]')
+        # accumulate start times in a plain list and convert to an array once
+        # at the end; np.append re-allocates the whole array on every granule
+        time_start_list = []
         s3_files_list = []
+        search_after = None
         completed_query = False
         while completed_query == False:
-            response = get_results(params=params)
-            if 'feed' in response.keys():
-                for curr_entry in response['feed']['entry']:
-                    time_start = np.append(time_start,np.datetime64(curr_entry['time_start'],'ns'))
-                    for curr_link in curr_entry['links']:
-                        if "direct download access via S3" in curr_link['title']:
-                            s3_files_list.append(curr_link['href'])
-                            break
-            elif 'errors' in response.keys():
-                raise Exception(response['errors'][0])
-            
-            if len(response['feed']['entry']) < 2000:
+            response,search_after = get_results(params=params,search_after=search_after)
+            n_entries = 0
+            for curr_entry in iter_entries(response):
+                n_entries += 1
+                time_start_list.append(curr_entry['time_start'])
+                for curr_link in curr_entry['links']:
+                    if "direct download access via S3" in curr_link['title']:
+                        s3_files_list.append(curr_link['href'])
+                        break
+
+            # CMR omits the CMR-Search-After header on the last page of results;
+            # a partially-filled page also means the search is complete
+            if ((search_after is None) or (n_entries < 2000)):
                 completed_query = True
-            else:
-                # do another CMR search since previous search hit the allowed maximum
-                # number of entries (2000)
-                params['temporal'] = str(np.datetime64(response['feed']['entry'][-1]['time_end'],'D')\
-                                         + np.timedelta64(1,'D'))+params['temporal'][10:]
+
+        time_start = np.array(time_start_list,dtype='datetime64[ns]')
 
         # reduce granule list to single day if only one day in requested range
         if (('MONTHLY' in ShortName) or ('DAILY' in ShortName)):
             if ((SingleDay_flag == True) and (len(s3_files_list) > 1)):
-                day_index = np.argmin(np.abs(time_start - np.datetime64(StartDate,'D')))
+                # time_start is monotonic (CMR returns granules chronologically),
+                # so find the granule nearest StartDate with a binary search
+                # rather than allocating a full absolute-difference array
+                target = np.datetime64(StartDate,'ns')
+                insert_index = np.searchsorted(time_start,target)
+                if insert_index == 0:
+                    day_index = 0
+                elif insert_index == len(time_start):
+                    day_index = len(time_start) - 1
+                elif (target - time_start[insert_index-1]) <= (time_start[insert_index] - target):
+                    day_index = insert_index - 1
+                else:
+                    day_index = insert_index
                 s3_files_list = s3_files_list[day_index:(day_index+1)]
 
         return s3_files_list
@@ -158,13 +280,12 @@ def ecco_podaac_s3_query(ShortName,StartDate,EndDate,snapshot_interval='monthly'
     # for snapshot datasets with monthly snapshot_interval, only include snapshots at beginning/end of months
     if 'SNAPSHOT' in ShortName:
         if snapshot_interval == 'monthly':
-            import re
-            s3_files_list_copy = list(tuple(s3_files_list))
-            for s3_file in s3_files_list:
-                snapshot_date = re.findall("_[0-9]{4}-[0-9]{2}-[0-9]{2}",s3_file)[0][1:]
-                if snapshot_date[8:] != '01':
-                    s3_files_list_copy.remove(s3_file)
-            s3_files_list = s3_files_list_copy
+            # boolean-mask the file list in a single vectorized pass, rather than
+            # re-running the regex and removing entries one at a time
+            files_arr = np.array(s3_files_list)
+            snapshot_days = np.array([_SNAP_RE.search(s3_file).group(1)[-2:]\
+                                      for s3_file in files_arr])
+            s3_files_list = files_arr[snapshot_days == '01'].tolist()
     
     
     return s3_files_list
@@ -174,28 +295,44 @@ def ecco_podaac_s3_query(ShortName,StartDate,EndDate,snapshot_interval='monthly'
 ###================================================================================================================
 
 
-def init_S3FileSystem():
-    
+def init_S3FileSystem(max_pool_connections=32):
+
     """
-    
-    This routine automatically pulls your EDL crediential from .netrc file and use it to obtain an AWS S3 credential 
+
+    This routine automatically pulls your EDL crediential from .netrc file and use it to obtain an AWS S3 credential
     through a PO.DAAC service accessible at https://archive.podaac.earthdata.nasa.gov/s3credentials.
     From the PO.DAAC Github (https://podaac.github.io/tutorials/external/July_2022_Earthdata_Webinar.html).
-    
+
+    Parameters
+    ----------
+    max_pool_connections: int, size of the underlying botocore connection pool.
+                          Should be >= the number of threads doing concurrent
+                          downloads/opens; botocore's default of 10 would
+                          silently serialize any additional threads.
+
     Returns:
-    =======        
+    =======
     s3: an AWS S3 filesystem
-    
+
     """
-    
-    import s3fs
-    
-    creds = requests.get('https://archive.podaac.earthdata.nasa.gov/s3credentials').json()
+
+    # return the cached filesystem if its credentials are still valid
+    # and its connection pool is large enough
+    if ((_S3FS_CACHE['s3'] is not None) and (time.time() < _S3FS_CACHE['expiry'] - 300)\
+      and (_S3FS_CACHE['max_pool_connections'] >= max_pool_connections)):
+        return _S3FS_CACHE['s3']
+
+    creds = _get_s3_creds()
     s3 = s3fs.S3FileSystem(anon=False,
                            key=creds['accessKeyId'],
-                           secret=creds['secretAccessKey'], 
-                           token=creds['sessionToken'])
-    
+                           secret=creds['secretAccessKey'],
+                           token=creds['sessionToken'],
+                           config_kwargs={'max_pool_connections': max_pool_connections})
+
+    _S3FS_CACHE['s3'] = s3
+    _S3FS_CACHE['expiry'] = _CREDS_CACHE['expiry']
+    _S3FS_CACHE['max_pool_connections'] = max_pool_connections
+
     return s3
 
 
@@ -233,8 +370,9 @@ def download_file(s3, url, output_dir, force):
         print(f'\n{basename(url)} already exists, and force=False, not re-downloading')
         return target_file
 
-    # download file to local (output) file directory
-    s3.get_file(url, target_file)
+    # download file to local (output) file directory,
+    # retrying transient S3 failures with backoff
+    _retry_s3_op(s3.get_file, url, target_file)
 
     return target_file
 
@@ -276,26 +414,47 @@ def download_files_s3_wrapper(s3, s3_files_list, download_dir, n_workers, force_
     """Wrapper for downloading functions"""
 
     pass
-    
+
+    # partition out files that already exist locally (unless force_redownload),
+    # so they never occupy executor tasks or S3 round-trips
+    cached_files = []
+    to_download = list(s3_files_list)
+    if force_redownload == False:
+        to_download = []
+        for u in s3_files_list:
+            target_file = join(download_dir, basename(u))
+            if isfile(target_file):
+                cached_files.append(target_file)
+            else:
+                to_download.append(u)
+        if len(cached_files) > 0:
+            print(f'{len(cached_files)} file(s) already exist locally '\
+                  +'and force_redownload=False, not re-downloading')
+
     try:
         # Attempt concurrent downloads, but if error arises switch to sequential downloads
-        ### Method 1: Concurrent downloads        
-        
+        ### Method 1: Concurrent downloads
+
         # Force redownload (or not) depending on value of force_redownload
-        downloaded_files = download_files_concurrently(s3, s3_files_list, download_dir, n_workers, force_redownload)
-        
-    except:
+        downloaded_files = cached_files \
+                           + download_files_concurrently(s3, to_download, download_dir, n_workers, force_redownload)
+
+    except (OSError, BotoCoreError, ClientError) as e:
+        # only network/S3 failures trigger the sequential fallback;
+        # KeyboardInterrupt and real bugs propagate to the caller
+        warnings.warn(f'Concurrent downloads failed ({e!r}); falling back to sequential downloads')
+
         ### Method 2: Sequential Downloads
-        
+
         start_time = time.time()
-        
+
         # Download each URL sequentially in a for loop.
         total_download_size_in_bytes = 0
-        
+
         # loop through all files
-        downloaded_files = []
-        for u in s3_files_list:
-            u_name = u.split('/')[-1]
+        downloaded_files = list(cached_files)
+        for u in to_download:
+            u_name = basename(u)
             print(f'downloading {u_name}')
             result = download_file(s3, url=u, output_dir=download_dir, force=force_redownload)
             downloaded_files.append(result)
@@ -307,7 +466,9 @@ def download_files_s3_wrapper(s3, s3_files_list, download_dir, n_workers, force_
         print('Time spent = ' + str(total_time_download) + ' seconds')
         print('\n')
 
-        return downloaded_files
+    # return from both the concurrent and sequential paths
+    # (previously only the sequential fallback returned the file list)
+    return downloaded_files
 
 
 
@@ -343,18 +504,30 @@ def ecco_podaac_s3_open(ShortName,StartDate,EndDate,snapshot_interval='monthly')
     
     """
 
-    pass    
-        
-    # get list of files
-    s3_files_list = ecco_podaac_s3_query(ShortName,StartDate,EndDate)
+    pass
+
+    # log into Earthdata synchronously first (a cheap netrc lookup when
+    # credentials exist), so the concurrent S3 credential fetch below does
+    # not race the first-run credential prompt
+    setup_earthdata_login_auth()
+
+    # the CMR query and the S3 credential/filesystem setup are independent,
+    # so run them concurrently to overlap their HTTPS round-trips
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        query_future = executor.submit(ecco_podaac_s3_query,ShortName,StartDate,EndDate)
+        s3_future = executor.submit(init_S3FileSystem)
+        # get list of files
+        s3_files_list = query_future.result()
+        # initiate S3 access
+        s3 = s3_future.result()
 
     num_grans = len(s3_files_list)
     print (f'\nTotal number of matching granules: {num_grans}')
-
-    # initiate S3 access
-    s3 = init_S3FileSystem()
-    # open files and create list that can be passed to xarray file opener
-    open_files = [s3.open(file) for file in s3_files_list]
+    # open files and create list that can be passed to xarray file opener;
+    # each s3.open issues a HEAD request to size the lazy file object,
+    # so drive the opens concurrently rather than stalling on each in turn
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        open_files = list(executor.map(s3.open,s3_files_list))
     # if list has length 1, return a string instead of a list
     if len(open_files) == 1:
         open_files = open_files[0]
@@ -395,11 +568,7 @@ def ecco_podaac_s3_open_fsspec(ShortName,jsons_root_dir):
     """
 
     pass
-    
-    import glob
-    import fsspec
-    
-    
+
     # identify where json file is found
     shortname_split = ShortName.split('_')
     if 'GEOMETRY' in ShortName:
@@ -422,8 +591,8 @@ def ecco_podaac_s3_open_fsspec(ShortName,jsons_root_dir):
     
     
     # get NASA Earthdata credentials for S3
-    creds = requests.get('https://archive.podaac.earthdata.nasa.gov/s3credentials').json()
-    
+    creds = _get_s3_creds()
+
     # generate map object
     fs = fsspec.filesystem(\
                 "reference", 
@@ -490,9 +659,6 @@ def ecco_podaac_s3_get(ShortName,StartDate,EndDate,snapshot_interval='monthly',d
     """
 
     pass
-    
-    from concurrent.futures import ThreadPoolExecutor
- 
 
     # set default download parent directory
     if download_root_dir==None:
@@ -504,15 +670,25 @@ def ecco_podaac_s3_get(ShortName,StartDate,EndDate,snapshot_interval='monthly',d
     # create the download directory
     download_dir.mkdir(exist_ok = True, parents=True)
     
-    # get list of files
-    s3_files_list = ecco_podaac_s3_query(ShortName,StartDate,EndDate)
-    
+    # log into Earthdata synchronously first (a cheap netrc lookup when
+    # credentials exist), so the concurrent S3 credential fetch below does
+    # not race the first-run credential prompt
+    setup_earthdata_login_auth()
+
+    # the CMR query and the S3 credential/filesystem setup are independent,
+    # so run them concurrently to overlap their HTTPS round-trips
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        query_future = executor.submit(ecco_podaac_s3_query,ShortName,StartDate,EndDate)
+        # size the botocore connection pool to the download worker count
+        s3_future = executor.submit(init_S3FileSystem,max(n_workers,32))
+        # get list of files
+        s3_files_list = query_future.result()
+        # initiate S3 access
+        s3 = s3_future.result()
+
     num_grans = len(s3_files_list)
     print (f'\nTotal number of matching granules: {num_grans}')
 
-    # initiate S3 access
-    s3 = init_S3FileSystem()
-
     # download files
     downloaded_files = download_files_s3_wrapper(s3, s3_files_list, download_dir, n_workers, force_redownload)
     
@@ -584,14 +760,12 @@ def ecco_podaac_s3_get_diskaware(ShortNames,StartDate,EndDate,snapshot_interval=
 
     pass
 
-    import shutil
-    
-    
     # force max_avail_frac to be within limits [0,0.9]
     max_avail_frac = np.fmin(np.fmax(max_avail_frac,0),0.9)
     
-    # initiate S3 access
-    s3 = init_S3FileSystem()
+    # initiate S3 access, sizing the botocore connection pool to the
+    # larger of the download and size-probe worker counts
+    s3 = init_S3FileSystem(max(n_workers,32))
 
     # determine value of snapshot_interval if None or not specified
     if snapshot_interval == None:
@@ -606,40 +780,62 @@ def ecco_podaac_s3_get_diskaware(ShortNames,StartDate,EndDate,snapshot_interval=
         download_root_dir = join(expanduser('~'),'Downloads','ECCO_V4r4_PODAAC')
 
     # add up total size of files that would be downloaded
-    dataset_sizes = np.array([])
+    dataset_sizes_list = []
     s3_files_list_all = []
+    download_dirs = {}
     for curr_shortname in ShortNames:
-        
+
         # get list of files
         s3_files_list = ecco_podaac_s3_query(curr_shortname,StartDate,EndDate,snapshot_interval)
-        
-        # create the download directory if it does not already exist
+
+        # create the download directory if it does not already exist,
+        # and remember it for the download branch below
         download_dir = Path(download_root_dir) / curr_shortname
         download_dir.mkdir(exist_ok = True, parents=True)
+        download_dirs[curr_shortname] = download_dir
         
-        # compute size of current dataset
+        # compute size of current dataset, counting only files not already on disk
+        missing_files = [s3_file for s3_file in s3_files_list \
+                         if isfile(join(download_dir,basename(s3_file))) == False]
         curr_dataset_size = 0
-        for s3_file in s3_files_list:
-            if isfile(join(download_dir,basename(s3_file))) == False:
-                curr_dataset_size += s3.info(s3_file)['size']
+        if len(missing_files) > 0:
+            # all granules of a ShortName live under a single S3 prefix,
+            # so one LIST of the common prefix replaces a HEAD request per object
+            try:
+                common_dir = os.path.commonprefix(missing_files).rsplit('/',1)[0]
+                listing = _retry_s3_op(partial(s3.ls,detail=True),common_dir)
+                sizes_by_name = {basename(obj['name']): obj.get('size') for obj in listing}
+            except (OSError, ClientError):
+                sizes_by_name = {}
+
+            missing_sizes = [sizes_by_name.get(basename(s3_file)) for s3_file in missing_files]
+            if None not in missing_sizes:
+                curr_dataset_size = sum(missing_sizes)
+            else:
+                # fall back to concurrent per-object HEAD requests if the
+                # listing did not report a size for every file
+                with ThreadPoolExecutor(max_workers=32) as executor:
+                    curr_dataset_size = sum(info['size'] for info in \
+                                            executor.map(partial(_retry_s3_op,s3.info),missing_files))
 
-        dataset_sizes = np.append(dataset_sizes,curr_dataset_size)
+        dataset_sizes_list.append(curr_dataset_size)
         s3_files_list_all.append(s3_files_list)
-            
 
-    # query available disk space at download location
-    query_disk_completed = False
-    query_dir = [download_root_dir][0]
-    while query_disk_completed == False:
+    dataset_sizes = np.asarray(dataset_sizes_list)
+
+
+    # query available disk space at download location, walking up the
+    # directory tree until an existing (mounted) parent is found
+    download_root_path = Path(download_root_dir)
+    for query_dir in [download_root_path, *download_root_path.parents]:
         try:
             avail_storage = shutil.disk_usage(query_dir).free
-            query_disk_completed = True
-        except:
-            try:
-                query_dir = join(*os.path.split(query_dir)[:-1])
-            except:                
-                print('Error: can not detect available disk space for download_root_dir: '+download_root_dir)
-                return -1
+            break
+        except FileNotFoundError:
+            continue
+    else:
+        print('Error: can not detect available disk space for download_root_dir: '+str(download_root_dir))
+        return -1
 
     # fraction of available storage that would be occupied by downloads
     sizes_sum = np.sum(dataset_sizes)
@@ -653,13 +849,9 @@ def ecco_podaac_s3_get_diskaware(ShortNames,StartDate,EndDate,snapshot_interval=
         # proceed with file downloads
         print('Proceeding with file downloads from S3')
         for curr_shortname,s3_files_list in zip(ShortNames,s3_files_list_all):
-            # set default download parent directory
-            if download_root_dir==None:
-                download_root_dir = join(expanduser('~'),'Downloads','ECCO_V4r4_PODAAC')
-        
-            # define the directory where the downloaded files will be saved
-            download_dir = Path(download_root_dir) / curr_shortname
-            
+            # reuse the download directory already created in the sizing loop
+            download_dir = download_dirs[curr_shortname]
+
             # download files
             downloaded_files = download_files_s3_wrapper(s3, s3_files_list, download_dir, n_workers, force_redownload)
 
@@ -675,8 +867,10 @@ def ecco_podaac_s3_get_diskaware(ShortNames,StartDate,EndDate,snapshot_interval=
               +'Generating file lists to open directly from S3.')
 
         for curr_shortname,s3_files_list in zip(ShortNames,s3_files_list_all):
-            # open files and create list that can be passed to xarray file opener
-            open_files = [s3.open(file) for file in s3_files_list]
+            # open files and create list that can be passed to xarray file opener;
+            # opens are concurrent since each one issues a HEAD request
+            with ThreadPoolExecutor(max_workers=32) as executor:
+                open_files = list(executor.map(s3.open,s3_files_list))
             # if list has length 1, return a string instead of a list
             if len(open_files) == 1:
                 open_files = open_files[0]